@@ -12,11 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from .datasets import app as datasets_app
-from .info import app as info_app
-from .login import app as login_app
-from .logout import app as logout_app
-from .training import app as training_app
-from .users import app as users_app
-from .whoami import app as whoami_app
-from .workspaces import app as workspaces_app
+import importlib
+from typing import Any
+
+_APPS = {
+    "datasets_app": ".datasets",
+    "info_app": ".info",
+    "login_app": ".login",
+    "logout_app": ".logout",
+    "training_app": ".training",
+    "users_app": ".users",
+    "whoami_app": ".whoami",
+    "workspaces_app": ".workspaces",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # The Typer apps are imported on first access, so importing `argilla.cli` doesn't import every subcommand
+    if name in _APPS:
+        return importlib.import_module(_APPS[name], __name__).app
+    raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -14,31 +14,42 @@
 
 import warnings
 
-from argilla.cli import (
-    datasets_app,
-    info_app,
-    login_app,
-    logout_app,
-    training_app,
-    users_app,
-    whoami_app,
-    workspaces_app,
-)
-from argilla.cli.typer_ext import ArgillaTyper
+from argilla.cli.typer_ext import ArgillaTyper, LazyTyperGroup
 from argilla.utils.dependency import is_package_with_extras_installed
 
 warnings.simplefilter("ignore", UserWarning)
 
-app = ArgillaTyper(help="Argilla CLI", no_args_is_help=True)
+
+class ArgillaCLIGroup(LazyTyperGroup):
+    lazy_subcommands = {
+        "datasets": "argilla.cli.datasets",
+        "info": "argilla.cli.info",
+        "login": "argilla.cli.login",
+        "logout": "argilla.cli.logout",
+        "train": "argilla.cli.training",
+        "users": "argilla.cli.users",
+        "whoami": "argilla.cli.whoami",
+        "workspaces": "argilla.cli.workspaces",
+    }
+
+
+if is_package_with_extras_installed("argilla", ["server"]):
+    ArgillaCLIGroup.lazy_subcommands["server"] = "argilla.cli.server"
+
+app = ArgillaTyper(cls=ArgillaCLIGroup, name="argilla", help="Argilla CLI", no_args_is_help=True)
+
+
+# Typer only builds a group if it has a callback or registered subcommands, and the latter are lazily loaded
+@app.callback()
+def callback() -> None:
+    pass
 
 
 @app.error_handler(PermissionError)
 def handler_permission_error(e: PermissionError) -> None:
     import sys
 
-    from rich.console import Console
-
-    from argilla.cli.rich import get_argilla_themed_panel
+    from argilla.cli.rich import get_argilla_themed_panel, get_console
 
     panel = get_argilla_themed_panel(
         "Logged in user doesn't have enough permissions to execute this command",
@@ -47,23 +58,9 @@ def handler_permission_error(e: PermissionError) -> None:
         success=False,
     )
 
-    Console().print(panel)
+    get_console().print(panel)
     sys.exit(1)
 
 
-app.add_typer(datasets_app, name="datasets")
-app.add_typer(info_app, name="info")
-app.add_typer(login_app, name="login")
-app.add_typer(logout_app, name="logout")
-app.add_typer(training_app, name="train")
-app.add_typer(users_app, name="users")
-app.add_typer(whoami_app, name="whoami")
-app.add_typer(workspaces_app, name="workspaces")
-
-if is_package_with_extras_installed("argilla", ["server"]):
-    from argilla.cli.server import app as server_app
-
-    app.add_typer(server_app, name="server")
-
 if __name__ == "__main__":
     app()
@@ -14,12 +14,12 @@
 
 import typer
 
-from argilla.cli.rich import echo_in_panel
-from argilla.client.api import init
-from argilla.client.login import ArgillaCredentials
-
 
 def init_callback() -> None:
+    from argilla.cli.rich import echo_in_panel
+    from argilla.client.api import init
+    from argilla.client.login import ArgillaCredentials
+
     if not ArgillaCredentials.exists():
         echo_in_panel(
             "You are not logged in. Please run 'argilla login' to login to an Argilla server.",
@@ -27,14 +27,12 @@ def list_datasets(
         help="The type of datasets to be listed. This option can be used multiple times. By default, all datasets are listed.",
     ),
 ) -> None:
-    from rich.console import Console
-
-    from argilla.cli.rich import echo_in_panel, get_argilla_themed_table
+    from argilla.cli.rich import echo_in_panel, get_argilla_themed_table, get_console
     from argilla.client.api import list_datasets as list_datasets_api
     from argilla.client.feedback.dataset.local import FeedbackDataset
     from argilla.client.workspaces import Workspace
 
-    console = Console()
+    console = get_console()
 
     def build_tags_text(tags: Dict[str, str]) -> str:
         text = ""
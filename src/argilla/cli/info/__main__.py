@@ -14,18 +14,29 @@
 
 import typer
 
-from argilla.cli.callback import init_callback
-
 app = typer.Typer(invoke_without_command=True)
 
 
 @app.callback(help="Displays information about the Argilla client and server")
-def info() -> None:
-    from rich.console import Console
-    from rich.markdown import Markdown
+def info(
+    ctx: typer.Context,
+    client_only: bool = typer.Option(
+        False, "--client-only", help="Just display the Argilla client version, without connecting to the server."
+    ),
+) -> None:
+    if ctx.invoked_subcommand is not None:
+        return
 
     from argilla._version import version
-    from argilla.cli.rich import get_argilla_themed_panel
+
+    if client_only:
+        typer.echo(version)
+        return
+
+    from rich.markdown import Markdown
+
+    from argilla.cli.callback import init_callback
+    from argilla.cli.rich import get_argilla_themed_panel, get_console
     from argilla.client.api import active_client
     from argilla.client.apis.status import Status
 
@@ -33,11 +44,9 @@ def info() -> None:
 
     server_info = Status(active_client().client).get_status()
 
-    elasticsearch_version = (
-        f"{server_info.elasticsearch.version.number} ({server_info.elasticsearch.version.distribution})"
-        if server_info.elasticsearch.version.distribution
-        else server_info.elasticsearch.version.number
-    )
+    elasticsearch_version = server_info.elasticsearch.version.number
+    if server_info.elasticsearch.version.distribution:
+        elasticsearch_version = " ".join((elasticsearch_version, f"({server_info.elasticsearch.version.distribution})"))
 
     panel = get_argilla_themed_panel(
         Markdown(
@@ -49,7 +58,7 @@ def info() -> None:
         title_align="left",
     )
 
-    Console().print(panel)
+    get_console().print(panel)
 
 
 if __name__ == "__main__":
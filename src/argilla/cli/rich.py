@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -24,6 +24,16 @@ if TYPE_CHECKING:
 # TODO: update colors after consulting it with UI expert
 _ARGILLA_BORDER_STYLE = "red"
 
+# Shared by all the CLI commands and created on first use, so the terminal capabilities are just detected once
+_CONSOLE: Optional[Console] = None
+
+
+def get_console() -> Console:
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console()
+    return _CONSOLE
+
 
 def get_argilla_themed_table(title: str, **kwargs: Any) -> Table:
     return Table(title=title, border_style=_ARGILLA_BORDER_STYLE, **kwargs)
@@ -36,4 +46,4 @@ def get_argilla_themed_panel(renderable: "RenderableType", title: str, success:
 
 
 def echo_in_panel(renderable: "RenderableType", title: str, success: bool = True, **kwargs: Any) -> None:
-    Console().print(get_argilla_themed_panel(renderable, title, success, **kwargs))
+    get_console().print(get_argilla_themed_panel(renderable, title, success, **kwargs))
@@ -13,11 +13,15 @@
 #  limitations under the License.
 
 import asyncio
+import importlib
 import sys
 from functools import wraps
-from typing import Any, Callable, Coroutine, Dict, Type, TypeVar
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Type, TypeVar
 
+import click
 import typer
+from typer.core import TyperGroup
+from typer.main import get_group
 
 if sys.version_info < (3, 10):
     from typing_extensions import ParamSpec
@@ -31,6 +35,27 @@ R = TypeVar("R")
 HandleErrorFunc = Callable[[Exception], None]
 
 
+class LazyTyperGroup(TyperGroup):
+    """A `TyperGroup` that only imports the Typer app of a subcommand when it's requested.
+
+    Subclasses define `lazy_subcommands`, mapping each subcommand name to the import path of the module
+    holding its Typer `app`. Rendering the help of the group still imports all of them, so it remains complete.
+    """
+
+    lazy_subcommands: Dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            command = get_group(module.app)
+            command.name = cmd_name
+            self.add_command(command)
+        return super().get_command(ctx, cmd_name)
+
+
 class ArgillaTyper(typer.Typer):
     error_handlers: Dict[Type[Exception], HandleErrorFunc] = {}
 
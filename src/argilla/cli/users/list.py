@@ -21,9 +21,7 @@ def list_users(
     workspace: Optional[str] = typer.Option(None, help="Filter users by workspace"),
     role: Optional[str] = typer.Option(None, help="Filter users by role"),
 ) -> None:
-    from rich.console import Console
-
-    from argilla.cli.rich import echo_in_panel, get_argilla_themed_table
+    from argilla.cli.rich import echo_in_panel, get_argilla_themed_table, get_console
     from argilla.client.sdk.v1.workspaces.models import WorkspaceModel
     from argilla.client.users import User
     from argilla.client.workspaces import Workspace
@@ -89,4 +87,4 @@ def list_users(
             user.updated_at.isoformat(sep=" "),
         )
 
-    Console().print(table)
+    get_console().print(table)
@@ -17,10 +17,8 @@ import typer
 
 def list_workspaces() -> None:
     """List the workspaces in Argilla and prints them on the console."""
-    from rich.console import Console
-
     from argilla import Workspace
-    from argilla.cli.rich import get_argilla_themed_table
+    from argilla.cli.rich import get_argilla_themed_table, get_console
 
     workspaces = Workspace.list()
 
@@ -36,8 +34,7 @@ def list_workspaces() -> None:
             workspace.updated_at.isoformat(sep=" "),
         )
 
-    console = Console()
-    console.print(table)
+    get_console().print(table)
 
 
 if __name__ == "__main__":
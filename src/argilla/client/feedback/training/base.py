@@ -12,25 +12,109 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
+import importlib
+import logging
 import os
-import textwrap
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
 from argilla.client.feedback.schemas.records import FeedbackRecord
 from argilla.client.feedback.training.schemas import TrainingTaskForTextClassification, TrainingTaskTypes
 from argilla.client.models import Framework, TextClassificationRecord
-from argilla.training import ArgillaTrainer as ArgillaTrainerV1
-
-os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
 
 if TYPE_CHECKING:
     import spacy
 
     from argilla.client.feedback.dataset import FeedbackDataset
 
+# Maps every supported framework to the module and class name of its trainer, and the extra arguments it accepts
+_FRAMEWORK_REGISTRY: Dict[Framework, Tuple[str, str, Tuple[str, ...]]] = {
+    Framework.SETFIT: ("argilla.client.feedback.training.frameworks.setfit", "ArgillaSetFitTrainer", ()),
+    Framework.TRANSFORMERS: (
+        "argilla.client.feedback.training.frameworks.transformers",
+        "ArgillaTransformersTrainer",
+        (),
+    ),
+    Framework.PEFT: ("argilla.client.feedback.training.frameworks.peft", "ArgillaPeftTrainer", ()),
+    Framework.SPACY: (
+        "argilla.client.feedback.training.frameworks.spacy",
+        "ArgillaSpaCyTrainer",
+        ("gpu_id", "framework_kwargs"),  # freeze_tok2vec
+    ),
+    Framework.SPACY_TRANSFORMERS: (
+        "argilla.client.feedback.training.frameworks.spacy",
+        "ArgillaSpaCyTransformersTrainer",
+        ("gpu_id", "framework_kwargs"),  # update_transformer
+    ),
+    Framework.OPENAI: ("argilla.client.feedback.training.frameworks.openai", "ArgillaOpenAITrainer", ()),
+    Framework.SPAN_MARKER: (
+        "argilla.client.feedback.training.frameworks.span_marker",
+        "ArgillaSpanMarkerTrainer",
+        (),
+    ),
+    Framework.TRL: ("argilla.client.feedback.training.frameworks.trl", "ArgillaTRLTrainer", ()),
+}
+
+# Frameworks that just support a subset of the training tasks
+_FRAMEWORK_SUPPORTED_TASKS: Dict[Framework, Tuple[Type[TrainingTaskTypes], ...]] = {
+    Framework.SETFIT: (TrainingTaskForTextClassification,),
+}
+
+# Frameworks relying on `torch`, which need the MPS fallback to be enabled before being imported
+_TORCH_FRAMEWORKS = frozenset(
+    {
+        Framework.SETFIT,
+        Framework.TRANSFORMERS,
+        Framework.PEFT,
+        Framework.SPACY,
+        Framework.SPACY_TRANSFORMERS,
+        Framework.SPAN_MARKER,
+        Framework.TRL,
+    }
+)
+
+_REPR_TEMPLATE = """\
+ArgillaBaseTrainer info:
+_________________________________________________________________
+These baseline params are fixed:
+    dataset: {dataset}
+    task: {task}
+    train_size: {train_size}
+    seed: {seed}
+
+
+{trainer_cls} info:
+_________________________________________________________________
+The parameters are configurable via `trainer.update_config()`:
+    {trainer}
+
+Using the trainer:
+_________________________________________________________________
+`trainer.train(output_dir)` to train to start training. `output_dir` is the directory to save the model automatically.
+`trainer.predict(text, as_argilla_records=True)` to make predictions.
+`trainer.save(output_dir)` to save the model manually.
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _to_framework(value: Union[Framework, str]) -> Framework:
+    if isinstance(value, Framework):
+        return value
+    return Framework(value.lower() if isinstance(value, str) else value)
+
+
+def _ensure_mps_fallback() -> None:
+    os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
+
+class ArgillaTrainer:
+    __slots__ = ("_dataset", "_task", "_model", "_seed", "_train_size", "_prepared_data", "_trainer")
+
+    # shares the logger with `argilla.training.ArgillaTrainer`, without importing it
+    _logger = logging.getLogger("ArgillaTrainer")
+    _logger.setLevel(logging.INFO)
 
-class ArgillaTrainer(ArgillaTrainerV1):
     def __init__(
         self,
         dataset: "FeedbackDataset",
@@ -70,6 +154,10 @@ class ArgillaTrainer(ArgillaTrainerV1):
         self._seed = seed  # split is used for train-test-split and should therefore be fixed
         self._model = model
 
+        framework = _to_framework(framework)
+        if framework in _TORCH_FRAMEWORKS:
+            _ensure_mps_fallback()
+
         self._prepared_data = self._dataset.prepare_for_training(
             framework=framework,
             task=task,
@@ -78,100 +166,38 @@ class ArgillaTrainer(ArgillaTrainerV1):
             lang=lang,
         )
 
-        if isinstance(framework, str):
-            framework = Framework(framework)
-
-        if framework is Framework.SETFIT:
-            if not isinstance(task, TrainingTaskForTextClassification):
-                raise NotImplementedError(f"{Framework.SETFIT} only supports `TextClassification` tasks.")
-            from argilla.client.feedback.training.frameworks.setfit import ArgillaSetFitTrainer
-
-            self._trainer = ArgillaSetFitTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        elif framework is Framework.TRANSFORMERS:
-            from argilla.client.feedback.training.frameworks.transformers import ArgillaTransformersTrainer
-
-            self._trainer = ArgillaTransformersTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        elif framework is Framework.PEFT:
-            from argilla.client.feedback.training.frameworks.peft import ArgillaPeftTrainer
-
-            self._trainer = ArgillaPeftTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        elif framework is Framework.SPACY:
-            from argilla.client.feedback.training.frameworks.spacy import ArgillaSpaCyTrainer
-
-            self._trainer = ArgillaSpaCyTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-                gpu_id=gpu_id,
-                framework_kwargs=framework_kwargs,  # freeze_tok2vec
-            )
-        elif framework is Framework.SPACY_TRANSFORMERS:
-            from argilla.client.feedback.training.frameworks.spacy import ArgillaSpaCyTransformersTrainer
-
-            self._trainer = ArgillaSpaCyTransformersTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-                gpu_id=gpu_id,
-                framework_kwargs=framework_kwargs,  # update_transformer
-            )
-        elif framework is Framework.OPENAI:
-            from argilla.client.feedback.training.frameworks.openai import ArgillaOpenAITrainer
-
-            self._trainer = ArgillaOpenAITrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        elif framework is Framework.SPAN_MARKER:
-            from argilla.client.feedback.training.frameworks.span_marker import ArgillaSpanMarkerTrainer
-
-            self._trainer = ArgillaSpanMarkerTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        elif framework is Framework.TRL:
-            from argilla.client.feedback.training.frameworks.trl import ArgillaTRLTrainer
-
-            self._trainer = ArgillaTRLTrainer(
-                dataset=self._dataset,
-                task=self._task,
-                prepared_data=self._prepared_data,
-                seed=self._seed,
-                model=self._model,
-            )
-        else:
+        supported_tasks = _FRAMEWORK_SUPPORTED_TASKS.get(framework)
+        if supported_tasks is not None and not isinstance(task, supported_tasks):
+            raise NotImplementedError(f"{framework} only supports `TextClassification` tasks.")
+
+        if framework not in _FRAMEWORK_REGISTRY:
             raise NotImplementedError(f"{framework} is not a valid framework.")
 
-        self._logger.info(self)
-        self._track_trainer_usage(framework=framework, task=self._task.__class__.__name__)
+        module_path, trainer_cls_name, extra_kwargs = _FRAMEWORK_REGISTRY[framework]
+        trainer_cls = getattr(importlib.import_module(module_path), trainer_cls_name)
+
+        trainer_kwargs = {
+            "dataset": self._dataset,
+            "task": self._task,
+            "prepared_data": self._prepared_data,
+            "seed": self._seed,
+            "model": self._model,
+        }
+        if "gpu_id" in extra_kwargs:
+            trainer_kwargs["gpu_id"] = gpu_id
+        if "framework_kwargs" in extra_kwargs:
+            trainer_kwargs["framework_kwargs"] = framework_kwargs
+        self._trainer = trainer_cls(**trainer_kwargs)
+
+        task_cls_name = type(self._task).__name__
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("%s", self)
+        self._track_trainer_usage(framework=framework, task=task_cls_name)
+
+    def _track_trainer_usage(self, framework: str, task: str) -> None:
+        from argilla.utils.telemetry import get_telemetry_client
+
+        get_telemetry_client().track_data(action="ArgillaTrainerUsage", data={"framework": framework, "task": task})
 
     def __repr__(self) -> str:
         """
@@ -180,28 +206,13 @@ class ArgillaTrainer(ArgillaTrainerV1):
         Returns:
           The trainer object.
         """
-        return textwrap.dedent(
-            f"""\
-            ArgillaBaseTrainer info:
-            _________________________________________________________________
-            These baseline params are fixed:
-                dataset: {self._dataset}
-                task: {self._task}
-                train_size: {self._train_size}
-                seed: {self._seed}
-
-
-            {self._trainer.__class__} info:
-            _________________________________________________________________
-            The parameters are configurable via `trainer.update_config()`:
-                {self._trainer}
-
-            Using the trainer:
-            _________________________________________________________________
-            `trainer.train(output_dir)` to train to start training. `output_dir` is the directory to save the model automatically.
-            `trainer.predict(text, as_argilla_records=True)` to make predictions.
-            `trainer.save(output_dir)` to save the model manually.
-            """
+        return _REPR_TEMPLATE.format(
+            dataset=self._dataset,
+            task=self._task,
+            train_size=self._train_size,
+            seed=self._seed,
+            trainer_cls=self._trainer.__class__,
+            trainer=self._trainer,
         )
 
     def predict(self, text: Union[List[str], str], as_argilla_records: bool = True, **kwargs):
@@ -218,8 +229,50 @@ class ArgillaTrainer(ArgillaTrainerV1):
         """
         return self._trainer.predict(text=text, as_argilla_records=False, **kwargs)
 
+    def update_config(self, *args, **kwargs) -> None:
+        """
+        It updates the configuration of the trainer, but the parameters depend on the trainer.subclass.
+        """
+        self._trainer.update_config(*args, **kwargs)
+        self._logger.info(
+            "Updated parameters:\n"
+            + "_________________________________________________________________\n"
+            + f"{self._trainer}"
+        )
+
+    def train(self, output_dir: str) -> None:
+        """
+        `train` takes in a path to a file and trains the model. If a path is provided,
+        the model is saved to that path.
+
+        Args:
+          output_dir (str): The path to the model file.
+        """
+        self._trainer.train(output_dir)
+
+    def save(self, output_dir: str) -> None:
+        """
+        Saves the model to the specified path.
+
+        Args:
+          output_dir (str): The path to the directory where the model will be saved.
+        """
+        self._trainer.save(output_dir)
+
 
 class ArgillaTrainerSkeleton(ABC):
+    __slots__ = (
+        "_dataset",
+        "_task",
+        "_model",
+        "_seed",
+        "_multi_label",
+        "_label_list",
+        "_label2id",
+        "_id2label",
+        "_record_class",
+    )
+
     def __init__(
         self,
         dataset: "FeedbackDataset",
@@ -235,7 +288,7 @@ class ArgillaTrainerSkeleton(ABC):
         self._dataset = prepared_data
         self._model = model
         self._seed = seed
-        if isinstance(self._task, TrainingTaskForTextClassification):
+        if self._task._is_text_classification:
             self._multi_label = self._task.__multi_label__ or False
             self._label_list = self._task.__all_labels__ or None
             self._label2id = self._task.__label2id__
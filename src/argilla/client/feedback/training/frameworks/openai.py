@@ -12,14 +12,25 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
+
 from argilla.client.feedback.training.base import ArgillaTrainerSkeleton
 from argilla.training.openai import ArgillaOpenAITrainer as ArgillaOpenAITrainerV1
 from argilla.utils.dependency import require_version
 
+_DEFAULT_MODEL = "gpt-3.5-turbo-0613"
+_SUPPORTED_MODELS = frozenset({_DEFAULT_MODEL})
+
+
+@functools.lru_cache(maxsize=None)
+def _require_openai_version() -> None:
+    # cached so the package metadata is read just once, failing checks raise so those are never cached
+    require_version("openai>=0.27.10")
+
 
 class ArgillaOpenAITrainer(ArgillaOpenAITrainerV1, ArgillaTrainerSkeleton):
     def __init__(self, *args, **kwargs) -> None:
-        require_version("openai>=0.27.10")
+        _require_openai_version()
         ArgillaTrainerSkeleton.__init__(self, *args, **kwargs)
 
         self.__legacy = False
@@ -31,7 +42,7 @@ class ArgillaOpenAITrainer(ArgillaOpenAITrainerV1, ArgillaTrainerSkeleton):
             self._logger.warning("Seed is not supported for OpenAI. Ignoring seed for training.")
 
         if self._model is None:
-            self._model = "gpt-3.5-turbo-0613"
+            self._model = _DEFAULT_MODEL
 
         if isinstance(self._dataset, tuple):
             self._train_dataset = self._dataset[0]
@@ -40,7 +51,7 @@ class ArgillaOpenAITrainer(ArgillaOpenAITrainerV1, ArgillaTrainerSkeleton):
             self._train_dataset = self._dataset
             self._eval_dataset = None
 
-        if self._model != "gpt-3.5-turbo-0613":
+        if self._model not in _SUPPORTED_MODELS:
             raise NotImplementedError("Legacy models are not supported for OpenAI with the FeedbackDataset.")
 
         self.init_training_args(model=self._model)
@@ -68,6 +68,7 @@ TASK_STRUCTURE = {
 
 class TrainingData(ABC):
     _formatting_func_return_types = None
+    _is_text_classification = False
 
     def _test_output_formatting_func(self, sample: Any):
         """
@@ -432,6 +433,7 @@ class TrainingTaskForTextClassification(BaseModel, TrainingData):
 
     formatting_func: Optional[Callable[[Dict[str, Any]], Union[None, str, List[str], Iterator[str]]]] = None
     _formatting_func_return_types = TrainingTaskForTextClassificationFormat
+    _is_text_classification = True
     text: Optional[TextField] = None
     label: Optional[
         Union[
@@ -14,7 +14,8 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Security, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla.server.contexts import datasets
@@ -26,7 +27,7 @@ from argilla.server.schemas.v1.responses import ResponseUpdate
 from argilla.server.search_engine import SearchEngine, get_search_engine
 from argilla.server.security import auth
 
-router = APIRouter(tags=["responses"])
+router = APIRouter(tags=["responses"], default_response_class=ORJSONResponse)
 
 
 async def _get_response(db: AsyncSession, response_id: UUID) -> Response:
@@ -45,7 +46,9 @@ async def update_response(
     db: AsyncSession = Depends(get_async_db),
     search_engine: SearchEngine = Depends(get_search_engine),
     response_id: UUID,
-    response_update: ResponseUpdate,
+    # FastAPI replaces the `Field` annotated in `ResponseUpdate` by its own `Body`, dropping the discriminator, so
+    # it's set again here to validate just the schema matching the `status` instead of trying the union in order
+    response_update: ResponseUpdate = Body(..., discriminator="status"),
     current_user: User = Security(auth.get_current_user),
 ):
     response = await _get_response(db, response_id)
@@ -23,8 +23,6 @@ from argilla.client.models import Framework, Text2TextRecord, TextClassification
 from argilla.datasets import TextClassificationSettings, TokenClassificationSettings, load_dataset_settings
 from argilla.utils.telemetry import get_telemetry_client
 
-os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
-
 if TYPE_CHECKING:
     import spacy
 
@@ -106,6 +104,9 @@ class ArgillaTrainer(object):
                 self._settings = self.dataset_full._infer_settings_from_records()
 
         framework = Framework(framework)
+        if framework is not Framework.OPENAI:
+            # `torch` reads it just once when imported, which may already happen while preparing the data
+            os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
         if framework in [Framework.SPACY, Framework.SPACY_TRANSFORMERS]:
             import spacy
 
@@ -61,6 +61,17 @@ def test_info_command(cli_runner: "CliRunner", cli: "Typer", mocker: "MockerFixt
     assert "ElasticSearch version: 1.2.3" in result.stdout
 
 
+@pytest.mark.usefixtures("not_logged_mock")
+def test_info_command_client_only(cli_runner: "CliRunner", cli: "Typer", mocker: "MockerFixture") -> None:
+    status_get_status_mock = mocker.patch("argilla.client.apis.status.Status.get_status")
+
+    result = cli_runner.invoke(cli, "info --client-only")
+
+    assert result.exit_code == 0
+    assert result.stdout == f"{version}\n"
+    status_get_status_mock.assert_not_called()
+
+
 @pytest.mark.usefixtures("not_logged_mock")
 def test_info_needs_login(cli_runner: "CliRunner", cli: "Typer") -> None:
     result = cli_runner.invoke(cli, "info")
@@ -0,0 +1,43 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+from argilla.cli.app import ArgillaCLIGroup
+
+if TYPE_CHECKING:
+    from click.testing import CliRunner
+    from pytest import MonkeyPatch
+    from typer import Typer
+
+
+def test_cli_app_import_does_not_import_subcommands(monkeypatch: "MonkeyPatch") -> None:
+    for name in list(sys.modules):
+        if name == "argilla.cli" or name.startswith("argilla.cli."):
+            monkeypatch.delitem(sys.modules, name)
+
+    importlib.import_module("argilla.cli.app")
+
+    assert not set(ArgillaCLIGroup.lazy_subcommands.values()) & set(sys.modules)
+
+
+def test_cli_help_lists_all_subcommands(cli_runner: "CliRunner", cli: "Typer") -> None:
+    result = cli_runner.invoke(cli, "--help")
+
+    assert result.exit_code == 0
+    assert "Usage: argilla [OPTIONS] COMMAND [ARGS]..." in result.stdout
+    commands = {line.strip("│ ").split(" ")[0] for line in result.stdout.splitlines() if line.startswith("│ ")}
+    assert {"datasets", "info", "login", "logout", "server", "train", "users", "whoami", "workspaces"} <= commands
@@ -0,0 +1,116 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import importlib
+import os
+import sys
+import types
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+from argilla.client.feedback.training import base
+from argilla.client.feedback.training.base import ArgillaTrainer
+from argilla.client.models import Framework
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
+
+class FakeDataset:
+    def __init__(self) -> None:
+        self.mps_fallback: Optional[str] = None
+
+    def prepare_for_training(self, **kwargs) -> None:
+        self.mps_fallback = os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK")
+
+
+class FakeTrainer:
+    def __init__(self, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_trainer_registry(monkeypatch: "MonkeyPatch") -> None:
+    module = types.ModuleType("fake_trainer_module")
+    module.FakeTrainer = FakeTrainer
+    monkeypatch.setitem(sys.modules, "fake_trainer_module", module)
+    for framework in base._TORCH_FRAMEWORKS:
+        monkeypatch.setitem(base._FRAMEWORK_REGISTRY, framework, ("fake_trainer_module", "FakeTrainer", ()))
+    monkeypatch.setattr(ArgillaTrainer, "_track_trainer_usage", lambda self, **kwargs: None)
+    monkeypatch.delenv("PYTORCH_ENABLE_MPS_FALLBACK", raising=False)
+
+
+@pytest.fixture
+def unload_openai_trainer(monkeypatch: "MonkeyPatch") -> str:
+    module_path = base._FRAMEWORK_REGISTRY[Framework.OPENAI][0]
+    for name in list(sys.modules):
+        if name == module_path or name == "argilla.training" or name.startswith("argilla.training."):
+            monkeypatch.delitem(sys.modules, name)
+    # required by `argilla.training.openai` at import time
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return module_path
+
+
+@pytest.mark.parametrize("framework", [Framework.SPACY, Framework.SPACY_TRANSFORMERS, Framework.TRANSFORMERS])
+@pytest.mark.usefixtures("fake_trainer_registry")
+def test_mps_fallback_is_set_before_preparing_data(framework: Framework) -> None:
+    dataset = FakeDataset()
+
+    ArgillaTrainer(dataset=dataset, task=None, framework=framework)
+
+    assert dataset.mps_fallback == "1"
+    assert os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK") == "1"
+
+
+@pytest.mark.usefixtures("fake_trainer_registry")
+def test_mps_fallback_keeps_user_value(monkeypatch: "MonkeyPatch") -> None:
+    monkeypatch.setenv("PYTORCH_ENABLE_MPS_FALLBACK", "0")
+    dataset = FakeDataset()
+
+    ArgillaTrainer(dataset=dataset, task=None, framework=Framework.SPACY)
+
+    assert dataset.mps_fallback == "0"
+    assert os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK") == "0"
+
+
+@pytest.mark.parametrize("mps_fallback", [None, "0"])
+def test_openai_trainer_import_leaves_mps_fallback_untouched(
+    monkeypatch: "MonkeyPatch", unload_openai_trainer: str, mps_fallback: Optional[str]
+) -> None:
+    if mps_fallback is None:
+        monkeypatch.delenv("PYTORCH_ENABLE_MPS_FALLBACK", raising=False)
+    else:
+        monkeypatch.setenv("PYTORCH_ENABLE_MPS_FALLBACK", mps_fallback)
+
+    importlib.import_module(unload_openai_trainer)
+
+    assert os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK") == mps_fallback
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("setfit", Framework.SETFIT),
+        ("SetFit", Framework.SETFIT),
+        ("SPACY-TRANSFORMERS", Framework.SPACY_TRANSFORMERS),
+        (Framework.OPENAI, Framework.OPENAI),
+    ],
+)
+def test_to_framework(value, expected: Framework) -> None:
+    assert base._to_framework(value) is expected
+
+
+def test_to_framework_with_unknown_name() -> None:
+    with pytest.raises(ValueError):
+        base._to_framework("unknown")
@@ -292,6 +292,52 @@ class TestSuiteResponses:
 
         assert resp.status_code == 422
 
+    async def test_update_response_with_invalid_status(
+        self, async_client: "AsyncClient", owner: "User", owner_auth_header: dict
+    ):
+        response = await ResponseFactory.create(user=owner)
+
+        response_json = {"values": {}, "status": "invalid"}
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+
+        assert resp.status_code == 422
+        errors = resp.json()["detail"]["params"]["errors"]
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ["body"]
+        assert errors[0]["type"] == "value_error.discriminated_union.invalid_discriminator"
+
+    async def test_update_response_without_status(
+        self, async_client: "AsyncClient", owner: "User", owner_auth_header: dict
+    ):
+        response = await ResponseFactory.create(user=owner)
+
+        resp = await async_client.put(
+            f"/api/v1/responses/{response.id}", headers=owner_auth_header, json={"values": {}}
+        )
+
+        assert resp.status_code == 422
+        errors = resp.json()["detail"]["params"]["errors"]
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ["body"]
+        assert errors[0]["type"] == "value_error.discriminated_union.missing_discriminator"
+
+    async def test_update_response_with_invalid_values(
+        self, async_client: "AsyncClient", owner: "User", owner_auth_header: dict
+    ):
+        response = await ResponseFactory.create(user=owner)
+
+        response_json = {"values": "invalid", "status": ResponseStatus.draft}
+        resp = await async_client.put(f"/api/v1/responses/{response.id}", headers=owner_auth_header, json=response_json)
+
+        assert resp.status_code == 422
+        assert resp.json()["detail"]["params"]["errors"] == [
+            {
+                "loc": ["body", "DraftResponseUpdate", "values"],
+                "msg": "value is not a valid dict",
+                "type": "type_error.dict",
+            }
+        ]
+
     async def test_update_response_as_annotator(self, async_client: "AsyncClient", db: "AsyncSession"):
         dataset = await DatasetFactory.create(status=DatasetStatus.ready)
         await TextQuestionFactory.create(name="input_ok", dataset=dataset)